@@ -75,6 +75,7 @@ class BackendManager(types.ModuleType):
         "check_random_state",
         "sort",
         "eigh",
+        "eigvalsh",
         "index_update",
         "context",
         "tensor",
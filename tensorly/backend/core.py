@@ -1074,6 +1074,9 @@ class Backend:
     def eigh(self, matrix):
         raise NotImplementedError
 
+    def eigvalsh(self, matrix):
+        raise NotImplementedError
+
     index = Index()
 
     @staticmethod
@@ -33,6 +33,16 @@ class CupyBackend(Backend, backend_name="cupy"):
     def is_tensor(tensor):
         return isinstance(tensor, cp.ndarray)
 
+    def randn(self, shape, seed=None, dtype=cp.float32, **kwargs):
+        """Returns a random tensor with samples from the “standard normal” distribution.
+
+        The samples are drawn on the GPU by a generator seeded from `seed`,
+        instead of being drawn by NumPy and copied to the device.
+        """
+        rng = self.check_random_state(seed)
+        gpu_rng = cp.random.RandomState(int(rng.randint(2**31)))
+        return gpu_rng.standard_normal(tuple(shape)).astype(dtype, copy=False)
+
     @staticmethod
     def to_numpy(tensor):
         if isinstance(tensor, cp.ndarray):
@@ -89,7 +99,7 @@ for name in (
 ):
     CupyBackend.register_method(name, getattr(cp, name))
 
-for name in ["svd", "qr", "eigh", "solve", "lstsq"]:
+for name in ["svd", "qr", "eigh", "eigvalsh", "solve", "lstsq"]:
     CupyBackend.register_method(name, getattr(cp.linalg, name))
 
 CupyBackend.register_method("gamma", cp.random.gamma)
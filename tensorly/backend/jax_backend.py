@@ -101,7 +101,7 @@ for name in (
 ):
     JaxBackend.register_method(name, getattr(np, name))
 
-for name in ["solve", "qr", "svd", "eigh"]:
+for name in ["solve", "qr", "svd", "eigh", "eigvalsh"]:
     JaxBackend.register_method(name, getattr(np.linalg, name))
 
 for name in ["gamma"]:
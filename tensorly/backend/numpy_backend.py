@@ -72,7 +72,7 @@ for name in (
 ):
     NumpyBackend.register_method(name, getattr(np, name))
 
-for name in ["solve", "qr", "svd", "eigh", "lstsq"]:
+for name in ["solve", "qr", "svd", "eigh", "eigvalsh", "lstsq"]:
     NumpyBackend.register_method(name, getattr(np.linalg, name))
 
 for name in ["digamma"]:
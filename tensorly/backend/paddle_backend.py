@@ -323,5 +323,5 @@ for name in (
 for name in ["kron", "moveaxis"]:
     PaddleBackend.register_method(name, getattr(paddle, name))
 
-for name in ["solve", "qr", "svd", "eigh"]:
+for name in ["solve", "qr", "svd", "eigh", "eigvalsh"]:
     PaddleBackend.register_method(name, getattr(paddle.linalg, name))
@@ -68,6 +68,25 @@ class PyTorchBackend(Backend, backend_name="pytorch"):
             tensor.requires_grad_(requires_grad)
         return tensor
 
+    def randn(self, shape, seed=None, dtype=None, device=None, requires_grad=None):
+        """Returns a random tensor with samples from the “standard normal” distribution.
+
+        The samples are drawn directly on `device` by a generator seeded from `seed`,
+        instead of being drawn by NumPy and copied to the device.
+        """
+        rng = self.check_random_state(seed)
+        generator = torch.Generator(device=device if device is not None else "cpu")
+        generator.manual_seed(int(rng.randint(2**31)))
+        tensor = torch.randn(
+            tuple(shape),
+            generator=generator,
+            dtype=dtype if dtype is not None else torch.float64,
+            device=device,
+        )
+        if requires_grad is not None:
+            tensor.requires_grad_(requires_grad)
+        return tensor
+
     @staticmethod
     def to_numpy(tensor):
         if torch.is_tensor(tensor):
@@ -252,5 +271,5 @@ for name in (
 for name in ["kron", "moveaxis"]:
     PyTorchBackend.register_method(name, getattr(torch, name))
 
-for name in ["solve", "qr", "svd", "eigh"]:
+for name in ["solve", "qr", "svd", "eigh", "eigvalsh"]:
     PyTorchBackend.register_method(name, getattr(torch.linalg, name))
@@ -119,7 +119,7 @@ class TensorflowBackend(Backend, backend_name="tensorflow"):
     def svd(self, matrix, full_matrices):
         """Correct for the atypical return order of tf.linalg.svd."""
         S, U, V = tf.linalg.svd(matrix, full_matrices=full_matrices)
-        return U, S, tf.transpose(a=V)
+        return U, S, tf.linalg.matrix_transpose(V)
 
     def index_update(self, tensor, indices, values):
         if not isinstance(tensor, tf.Variable):
@@ -151,7 +151,7 @@ for name in ["nan"]:
 
 
 # Register linalg functions
-for name in ["diag", "eigh", "trace"]:
+for name in ["diag", "eigh", "eigvalsh", "trace"]:
     TensorflowBackend.register_method(name, getattr(tf.linalg, name))
 
 
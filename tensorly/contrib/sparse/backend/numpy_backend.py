@@ -18,6 +18,10 @@ if Version(sparse.__version__) < _MIN_SPARSE_VERSION:
     )
 
 
+# n_eigenvecs / min_dim ratio above which partial_svd uses a dense SVD for dense matrices
+_DENSE_SVD_RATIO = 0.1
+
+
 def is_sparse(x):
     return isinstance(x, sparse.SparseArray)
 
@@ -89,6 +93,30 @@ class NumpySparseBackend(Backend, backend_name="numpy.sparse"):
         return x
 
     def partial_svd(self, matrix, n_eigenvecs=None, random_state=None, **kwargs):
+        """Computes the leading singular vectors and values of a (sparse) matrix
+
+        Dense matrices use a dense SVD, unless n_eigenvecs <= 0.1 * min_dim: Lanczos
+        iterations (eigsh) are only faster than a dense SVD when few singular vectors
+        are requested. Sparse matrices always use eigsh on the Gram matrix operator,
+        or a dense eigendecomposition of the Gram matrix if n_eigenvecs == min_dim.
+
+        Parameters
+        ----------
+        matrix : 2D-array, dense or sparse
+        n_eigenvecs : int, optional, default is None
+            number of singular vectors and values to return, required for sparse matrices
+        random_state : {None, int, np.random.RandomState}
+            used to initialize eigsh
+
+        Returns
+        -------
+        U : 2D-array
+            of shape (matrix.shape[0], n_eigenvecs)
+        S : 1D-array
+            of shape (n_eigenvecs, )
+        V : 2D-array
+            of shape (n_eigenvecs, matrix.shape[1])
+        """
         # Check that matrix is... a matrix!
         if matrix.ndim != 2:
             raise ValueError(
@@ -102,7 +130,9 @@ class NumpySparseBackend(Backend, backend_name="numpy.sparse"):
         else:
             min_dim = dim_2
 
-        if not is_sparse(matrix) and (n_eigenvecs is None or n_eigenvecs >= min_dim):
+        if not is_sparse(matrix) and (
+            n_eigenvecs is None or n_eigenvecs > _DENSE_SVD_RATIO * min_dim
+        ):
             if n_eigenvecs is None or n_eigenvecs > min_dim:
                 full_matrices = True
             else:
@@ -132,29 +162,40 @@ class NumpySparseBackend(Backend, backend_name="numpy.sparse"):
             # initilize with [-1, 1] as in ARPACK
             v0 = rng.uniform(-1, 1, min_dim)
 
+            if is_sparse(matrix):
+                matrix = matrix.to_scipy_sparse().tocsr()
+            # Complex dtypes are rejected above, so the conjugate transpose
+            # is a plain transpose: compute it once and reuse it
+            matrix_H = matrix.T
+
             # First choose whether to use X * X.T or X.T *X
+            # eigsh only needs their action on a vector: apply them as two
+            # matrix-vector products rather than explicitly forming them
             if dim_1 < dim_2:
-                conj = matrix.T
-                xxT = matrix.dot(conj)
-                if is_sparse(xxT):
-                    xxT = xxT.to_scipy_sparse()
-                if n_eigenvecs >= xxT.shape[0]:
+                if n_eigenvecs >= min_dim:
                     # use dense form when sparse form will fail
-                    S, U = scipy.linalg.eigh(xxT.toarray())
+                    S, U = scipy.linalg.eigh(matrix.dot(matrix_H).toarray())
                 else:
+                    xxT = scipy.sparse.linalg.LinearOperator(
+                        (min_dim, min_dim),
+                        matvec=lambda x: matrix.dot(matrix_H.dot(x)),
+                        dtype=matrix.dtype,
+                    )
                     S, U = scipy.sparse.linalg.eigsh(
                         xxT, k=n_eigenvecs, which="LM", v0=v0
                     )
                 S = np.sqrt(S)
-                V = conj.dot(U / S[None, :])
+                V = matrix_H.dot(U / S[None, :])
             else:
-                xTx = matrix.T.dot(matrix)
-                if is_sparse(xTx):
-                    xTx = xTx.to_scipy_sparse()
-                if n_eigenvecs >= xTx.shape[0]:
+                if n_eigenvecs >= min_dim:
                     # use dense form when sparse form will fail
-                    S, V = scipy.linalg.eigh(xTx.toarray())
+                    S, V = scipy.linalg.eigh(matrix_H.dot(matrix).toarray())
                 else:
+                    xTx = scipy.sparse.linalg.LinearOperator(
+                        (min_dim, min_dim),
+                        matvec=lambda x: matrix_H.dot(matrix.dot(x)),
+                        dtype=matrix.dtype,
+                    )
                     S, V = scipy.sparse.linalg.eigsh(
                         xTx, k=n_eigenvecs, which="LM", v0=v0
                     )
@@ -163,7 +204,8 @@ class NumpySparseBackend(Backend, backend_name="numpy.sparse"):
 
             # WARNING: here, V is still the transpose of what it should be
             U, S, V = U[:, ::-1], S[::-1], V[:, ::-1]
-        return U, S, V.T.conj()
+        # Only real matrices reach this point: no need to conjugate V
+        return U, S, V.T
 
 
 for name in [
@@ -0,0 +1,71 @@
+from .... import backend as tl
+
+import pytest
+
+if not tl.get_backend() == "numpy":
+    pytest.skip("Tests for sparse only with numpy backend", allow_module_level=True)
+pytest.importorskip("sparse")
+
+import sparse
+import numpy as np
+import scipy.linalg
+from numpy.testing import assert_array_almost_equal
+
+from ..backend.numpy_backend import NumpySparseBackend
+
+
+def _to_dense(tensor):
+    return tensor.todense() if hasattr(tensor, "todense") else np.asarray(tensor)
+
+
+def _check_partial_svd(matrix, dense_matrix, n_eigenvecs):
+    U, S, V = NumpySparseBackend().partial_svd(
+        matrix, n_eigenvecs=n_eigenvecs, random_state=1234
+    )
+    U, V = _to_dense(U), _to_dense(V)
+
+    true_U, true_S, true_V = scipy.linalg.svd(dense_matrix, full_matrices=False)
+    true_U, true_S, true_V = (
+        true_U[:, :n_eigenvecs],
+        true_S[:n_eigenvecs],
+        true_V[:n_eigenvecs, :],
+    )
+
+    assert U.shape == (dense_matrix.shape[0], n_eigenvecs)
+    assert V.shape == (n_eigenvecs, dense_matrix.shape[1])
+    assert_array_almost_equal(S, true_S)
+    assert_array_almost_equal(
+        np.dot(U * S, V), np.dot(true_U * true_S, true_V), decimal=5
+    )
+
+
+@pytest.mark.parametrize("shape", [(20, 30), (30, 20), (25, 25)])
+@pytest.mark.parametrize("n_eigenvecs", [3, "min_dim"])
+def test_sparse_partial_svd(shape, n_eigenvecs):
+    """Test partial_svd on sparse matrices, with eigsh and the dense fallback"""
+    if n_eigenvecs == "min_dim":
+        n_eigenvecs = min(shape)
+    matrix = sparse.random(shape, density=0.5, random_state=1234)
+    _check_partial_svd(matrix, matrix.todense(), n_eigenvecs)
+
+
+@pytest.mark.parametrize("shape", [(40, 60), (60, 40)])
+def test_dense_partial_svd_eigsh(shape):
+    """Test partial_svd on dense matrices when few singular vectors use eigsh"""
+    rng = np.random.RandomState(1234)
+    matrix = rng.random_sample(shape)
+    # n_eigenvecs <= 0.1 * min_dim, below which eigsh is used
+    _check_partial_svd(matrix, matrix, n_eigenvecs=4)
+
+
+def test_sparse_partial_svd_zeros():
+    """Test partial_svd quick return on an all-zero sparse matrix"""
+    matrix = sparse.COO.from_numpy(np.zeros((20, 30)))
+    U, S, V = NumpySparseBackend().partial_svd(matrix, n_eigenvecs=3)
+
+    assert U.shape == (20, 3)
+    assert V.shape == (3, 30)
+    assert_array_almost_equal(S, np.zeros(3))
+    assert_array_almost_equal(
+        np.dot(_to_dense(U) * S, _to_dense(V)), np.zeros((20, 30))
+    )
@@ -1,7 +1,7 @@
 import warnings
 from typing import Literal
+import scipy.linalg
 import tensorly as tl
-from .proximal import soft_thresholding
 
 # Authors: Jean Kossaifi <jean.kossaifi+tensors@gmail.com>
 #          Meraj Hashemizadeh <merajhse@mila.quebec>
@@ -29,36 +29,28 @@ def svd_flip(U, V, u_based_decision=True):
     -------
     u_adjusted, v_adjusted : arrays with the same dimensions as the input.
     """
+    n_U, n_V = tl.shape(U)[1], tl.shape(V)[0]
+
     if u_based_decision:
         # columns of U, rows of V
         max_abs_cols = tl.argmax(tl.abs(U), axis=0)
-        signs = tl.sign(
-            tl.tensor(
-                [U[i, j] for (i, j) in zip(max_abs_cols, range(tl.shape(U)[1]))],
-                **tl.context(U),
-            )
-        )
+        signs = tl.sign(U[max_abs_cols, list(range(n_U))])
         U = U * signs
-        if tl.shape(V)[0] > tl.shape(U)[1]:
-            signs = tl.concatenate(
-                (signs, tl.ones(tl.shape(V)[0] - tl.shape(U)[1], **tl.context(V)))
-            )
-        V = V * signs[: tl.shape(V)[0]][:, None]
+        if n_V > n_U:
+            signs = tl.concatenate((signs, tl.ones(n_V - n_U, **tl.context(V))))
+        elif n_V < n_U:
+            signs = signs[:n_V]
+        V = V * signs[:, None]
     else:
         # rows of V, columns of U
         max_abs_rows = tl.argmax(tl.abs(V), axis=1)
-        signs = tl.sign(
-            tl.tensor(
-                [V[i, j] for (i, j) in zip(range(tl.shape(V)[0]), max_abs_rows)],
-                **tl.context(V),
-            )
-        )
+        signs = tl.sign(V[list(range(n_V)), max_abs_rows])
         V = V * signs[:, None]
-        if tl.shape(U)[1] > tl.shape(V)[0]:
-            signs = tl.concatenate(
-                (signs, tl.ones(tl.shape(U)[1] - tl.shape(V)[0], **tl.context(V)))
-            )
-        U = U * signs[: tl.shape(U)[1]]
+        if n_U > n_V:
+            signs = tl.concatenate((signs, tl.ones(n_U - n_V, **tl.context(V))))
+        elif n_U < n_V:
+            signs = signs[:n_U]
+        U = U * signs
 
     return U, V
 
@@ -88,43 +80,43 @@ def make_svd_non_negative(tensor, U, S, V, nntype=True):
     W = tl.index_update(W, tl.index[:, 0], tl.sqrt(S[0]) * tl.abs(U[:, 0]))
     H = tl.index_update(H, tl.index[0, :], tl.sqrt(S[0]) * tl.abs(V[0, :]))
 
-    for j in range(1, min(tl.shape(U)[1], tl.shape(V)[0])):
-        x, y = U[:, j], V[j, :]
+    # The remaining singular triplets are processed all at once
+    n_components = min(tl.shape(U)[1], tl.shape(V)[0])
+    x, y = U[:, 1:n_components], V[1:n_components, :]
 
-        # extract positive and negative parts of column vectors
-        x_p, y_p = tl.clip(x, a_min=0.0), tl.clip(y, a_min=0.0)
-        x_n, y_n = tl.abs(tl.clip(x, a_max=0.0)), tl.abs(tl.clip(y, a_max=0.0))
+    # extract positive and negative parts of column vectors, using x = x_p - x_n
+    x_p, y_p = tl.clip(x, a_min=0.0), tl.clip(y, a_min=0.0)
+    x_n, y_n = x_p - x, y_p - y
 
-        # and their norms
-        x_p_nrm, y_p_nrm = tl.norm(x_p), tl.norm(y_p)
-        x_n_nrm, y_n_nrm = tl.norm(x_n), tl.norm(y_n)
+    # and their norms
+    x_p_nrm, y_p_nrm = tl.norm(x_p, axis=0), tl.norm(y_p, axis=1)
+    x_n_nrm, y_n_nrm = tl.norm(x_n, axis=0), tl.norm(y_n, axis=1)
 
-        m_p, m_n = x_p_nrm * y_p_nrm, x_n_nrm * y_n_nrm
+    m_p, m_n = x_p_nrm * y_p_nrm, x_n_nrm * y_n_nrm
 
-        # choose update
-        if m_p > m_n:
-            u = x_p / x_p_nrm
-            v = y_p / y_p_nrm
-            sigma = m_p
-        else:
-            u = x_n / x_n_nrm
-            v = y_n / y_n_nrm
-            sigma = m_n
+    # choose update
+    use_p = m_p > m_n
+    u = tl.where(use_p[None, :], x_p, x_n)
+    v = tl.where(use_p[:, None], y_p, y_n)
+    u_nrm = tl.where(use_p, x_p_nrm, x_n_nrm)
+    v_nrm = tl.where(use_p, y_p_nrm, y_n_nrm)
+    sigma = tl.where(use_p, m_p, m_n)
 
-        lbd = tl.sqrt(S[j] * sigma)
-        W = tl.index_update(W, tl.index[:, j], lbd * u)
-        H = tl.index_update(H, tl.index[j, :], lbd * v)
+    lbd = tl.sqrt(S[1:n_components] * sigma)
+    W = tl.index_update(W, tl.index[:, 1:n_components], u * (lbd / u_nrm)[None, :])
+    H = tl.index_update(H, tl.index[1:n_components, :], v * (lbd / v_nrm)[:, None])
 
     # After this point we no longer need H
     eps = tl.eps(tensor.dtype)
 
+    # W and H are non-negative: soft-thresholding them reduces to a shifted clip
     if nntype == "nndsvd":
-        W = soft_thresholding(W, eps)
-        H = soft_thresholding(H, eps)
+        W = tl.clip(W - eps, a_min=0.0)
+        H = tl.clip(H - eps, a_min=0.0)
     elif nntype == "nndsvda":
         avg = tl.mean(tensor)
-        W = tl.where(W < eps, tl.ones(tl.shape(W), **tl.context(W)) * avg, W)
-        H = tl.where(H < eps, tl.ones(tl.shape(H), **tl.context(H)) * avg, H)
+        W = tl.where(W < eps, avg, W)
+        H = tl.where(H < eps, avg, H)
     else:
         raise ValueError(
             f'Invalid nntype parameter: got {nntype} instead of one of ("nndsvd", "nndsvda")'
@@ -133,7 +125,85 @@ def make_svd_non_negative(tensor, U, S, V, nntype=True):
     return W, H
 
 
-def randomized_range_finder(A, n_dims, n_iter=2, random_state=None):
+def _conj(tensor):
+    """Returns the complex conjugate of tensor.
+
+    Real tensors are returned as is, which avoids allocating
+    a conjugated copy of the tensor.
+    """
+    if tl.context(tensor)["dtype"] in (tl.complex64, tl.complex128):
+        return tl.conj(tensor)
+    return tensor
+
+
+def _conj_transpose(matrix):
+    """Returns the conjugate transpose of matrix, which is a transpose for real matrices."""
+    return _conj(tl.transpose(matrix))
+
+
+def _gram_qr(Y):
+    """Orthonormalizes the columns of Y using the eigendecomposition of its Gram matrix.
+
+    For tall-skinny matrices this only requires two matrix products and a small
+    eigendecomposition, which is cheaper than a Householder QR, especially on GPU.
+    It is only accurate when Y is tall and well-conditioned: otherwise, None is
+    returned and the caller should use QR instead. The Gram matrix and its
+    eigendecomposition are then computed for nothing, so callers should stop
+    trying once Y turned out to be ill-conditioned.
+
+    Parameters
+    ----------
+    Y : 2D-array
+
+    Returns
+    -------
+    Q : 2D-array or None
+        orthonormal basis of the range of Y, None if Y is wide or ill-conditioned
+    """
+    dim_1, dim_2 = tl.shape(Y)
+    if dim_1 < dim_2:
+        return None
+
+    S, V = tl.eigh(tl.dot(_conj_transpose(Y), Y))
+    # Orthogonality is lost in proportion to the squared condition number of Y
+    if tl.min(S) <= tl.eps(S.dtype) ** 0.5 * tl.max(S):
+        return None
+    return tl.dot(Y, V / tl.reshape(tl.sqrt(S), (1, -1)))
+
+
+def _lu_normalize(Y):
+    """Normalizes the columns of Y using the pivoted LU decomposition of Y.
+
+    The returned permuted L factor spans the range of Y without being orthonormal,
+    which is enough to keep power iterations well-conditioned at about half the
+    cost of a QR. The LU decomposition is only available with the NumPy backend,
+    other backends fall back on QR.
+
+    Parameters
+    ----------
+    Y : 2D-array
+
+    Returns
+    -------
+    PL : 2D-array
+        well-conditioned basis of the range of Y
+    """
+    if tl.get_backend() == "numpy":
+        PL, _ = scipy.linalg.lu(Y, permute_l=True)
+        return PL
+
+    Q, _ = tl.qr(Y)
+    return Q
+
+
+def randomized_range_finder(
+    A,
+    n_dims,
+    n_iter=2,
+    random_state=None,
+    power_iteration_normalizer="gram",
+    iteration="subspace",
+):
     """Computes an orthonormal matrix (Q) whose range approximates the range of A,  i.e., Q Q^H A ≈ A
 
     Parameters
@@ -142,33 +212,99 @@ def randomized_range_finder(A, n_dims, n_iter=2, random_state=None):
     n_dims : int, dimension of the returned subspace
     n_iter : int, number of power iterations to conduct (default = 2)
     random_state: {None, int, np.random.RandomState}
+    power_iteration_normalizer : {'gram', 'LU', 'QR', 'none'}, default is 'gram'
+        How the intermediate power iterations are normalized: through the Gram matrix,
+        with a pivoted LU decomposition (NumPy backend only, QR otherwise), with a QR
+        decomposition, or not at all. The returned basis is always orthonormalized with QR.
+        The Gram normalization requires a well-conditioned basis: for (numerically) low
+        rank A, it falls back on QR after the first attempt, which costs one extra
+        Gram matrix and small eigendecomposition.
+    iteration : {'subspace', 'block_krylov'}, default is 'subspace'
+        If 'subspace', only the last power iteration is kept. If 'block_krylov', the
+        range of all the power iterations is returned, which converges faster for
+        slowly decaying spectra at the cost of a basis (n_iter + 1) times larger.
 
     Returns
     -------
     Q : 2D-array
-        of shape (A.shape[0], min(n_dims, A.shape[0], A.shape[1]))
+        of shape (A.shape[0], min(n_dims, A.shape[0], A.shape[1])), with n_dims
+        multiplied by (n_iter + 1) if iteration is 'block_krylov'
 
     Notes
     -----
     This function is implemented based on Algorith 4.4 in `Finding structure with randomness:
     Probabilistic algorithms for constructing approximate matrix decompositions`
     - Halko et al (2009)
+
+    The block Krylov iteration is Algorithm 2 in `Randomized block Krylov methods for stronger
+    and faster approximate singular value decomposition` - Musco and Musco (2015)
     """
+    if iteration not in ["subspace", "block_krylov"]:
+        raise ValueError(
+            f"Got iteration={iteration}. "
+            "However, the possible choices are 'subspace' or 'block_krylov'."
+        )
+
+    if power_iteration_normalizer == "gram":
+        use_gram = True
+
+        def normalize(Y):
+            nonlocal use_gram
+            if use_gram:
+                Q = _gram_qr(Y)
+                if Q is not None:
+                    return Q
+                # The rank deficiency of A persists across iterations: only use QR from now on
+                use_gram = False
+            return tl.qr(Y)[0]
+
+    elif power_iteration_normalizer == "LU":
+        normalize = _lu_normalize
+    elif power_iteration_normalizer == "QR":
+        normalize = lambda Y: tl.qr(Y)[0]
+    elif power_iteration_normalizer == "none":
+        normalize = lambda Y: Y
+    else:
+        raise ValueError(
+            f"Got power_iteration_normalizer={power_iteration_normalizer}. "
+            "However, the possible choices are 'gram', 'LU', 'QR' or 'none'."
+        )
+
     rng = tl.check_random_state(random_state)
     dim_1, dim_2 = tl.shape(A)
-    Q = tl.tensor(rng.normal(size=(dim_2, n_dims)), **tl.context(A))
-    Q, _ = tl.qr(tl.dot(A, Q))
+    Q = tl.randn((dim_2, n_dims), seed=rng, **tl.context(A))
+    Q = normalize(tl.dot(A, Q))
+    # Block Krylov iterations keep the basis of every power iteration
+    blocks = [Q]
+    keep_blocks = iteration == "block_krylov"
 
     # Perform power iterations when spectrum decays slowly
-    A_H = tl.conj(tl.transpose(A))
-    for i in range(n_iter):
-        Q, _ = tl.qr(tl.dot(A_H, Q))
-        Q, _ = tl.qr(tl.dot(A, Q))
+    A_H = _conj_transpose(A)
+    if n_iter and dim_1 * (dim_2 + n_iter * n_dims) < 2 * n_iter * dim_2 * n_dims:
+        # For short and wide A, forming the small Gram matrix A A^H once is cheaper
+        # than two products with A per iteration
+        AA_H = tl.dot(A, A_H)
+        for i in range(n_iter):
+            Q = normalize(tl.dot(AA_H, Q))
+            if keep_blocks:
+                blocks.append(Q)
+    else:
+        for i in range(n_iter):
+            Q = normalize(tl.dot(A_H, Q))
+            Q = normalize(tl.dot(A, Q))
+            if keep_blocks:
+                blocks.append(Q)
+
+    if keep_blocks:
+        Q = tl.concatenate(blocks, axis=1)
+
+    # A final QR guarantees an orthonormal basis up to machine precision
+    Q, _ = tl.qr(Q)
 
     return Q
 
 
-def svd_checks(matrix, n_eigenvecs=None):
+def svd_checks(matrix, n_eigenvecs=None, batched=False):
     """Runs common checks to all of the SVD methods.
 
     Parameters
@@ -176,6 +312,8 @@ def svd_checks(matrix, n_eigenvecs=None):
     matrix : 2D-array
     n_eigenvecs : int, optional, default is None
         if specified, number of eigen[vectors-values] to return
+    batched : bool, optional, default is False
+        if True, matrix can also be a stack of matrices along its leading dimensions
 
     Returns
     -------
@@ -187,10 +325,14 @@ def svd_checks(matrix, n_eigenvecs=None):
         the maximum dimension of matrix
     """
     # Check that matrix is... a matrix!
-    if tl.ndim(matrix) != 2:
+    if batched and tl.ndim(matrix) < 2:
+        raise ValueError(
+            f"matrix be a matrix or a stack of matrices. matrix.ndim is {tl.ndim(matrix)} < 2"
+        )
+    elif not batched and tl.ndim(matrix) != 2:
         raise ValueError(f"matrix be a matrix. matrix.ndim is {tl.ndim(matrix)} != 2")
 
-    dim_1, dim_2 = tl.shape(matrix)
+    dim_1, dim_2 = tl.shape(matrix)[-2:]
     min_dim, max_dim = min(dim_1, dim_2), max(dim_1, dim_2)
 
     if n_eigenvecs is None:
@@ -212,6 +354,7 @@ def truncated_svd(matrix, n_eigenvecs=None, **kwargs):
     Parameters
     ----------
     matrix : 2D-array
+        or a stack of matrices along the leading dimensions, which are decomposed at once
     n_eigenvecs : int, optional, default is None
         if specified, number of eigen[vectors-values] to return
 
@@ -227,13 +370,38 @@ def truncated_svd(matrix, n_eigenvecs=None, **kwargs):
         of shape (n_eigenvecs, matrix.shape[1])
         contains the left singular vectors
     """
-    n_eigenvecs, min_dim, _ = svd_checks(matrix, n_eigenvecs=n_eigenvecs)
+    n_eigenvecs, min_dim, _ = svd_checks(matrix, n_eigenvecs=n_eigenvecs, batched=True)
     full_matrices = True if n_eigenvecs > min_dim else False
     U, S, V = tl.svd(matrix, full_matrices=full_matrices)
-    return U[:, :n_eigenvecs], S[:n_eigenvecs], V[:n_eigenvecs, :]
+    return U[..., :n_eigenvecs], S[..., :n_eigenvecs], V[..., :n_eigenvecs, :]
+
 
+def _gram(matrix, transpose=False):
+    """Computes matrix matrix^T, or matrix^T matrix if transpose is True.
 
-def symeig_svd(matrix, n_eigenvecs=None, **kwargs):
+    With the NumPy backend and a real matrix, uses the BLAS syrk routine which
+    does half the work of a matrix product by only computing the lower triangle.
+    The result is therefore only meant to be passed to `tl.eigh` or `tl.eigvalsh`,
+    which read that triangle.
+    """
+    if (
+        tl.get_backend() == "numpy"
+        and tl.ndim(matrix) == 2
+        and matrix.dtype in (tl.float32, tl.float64)
+    ):
+        syrk = scipy.linalg.blas.get_blas_funcs("syrk", (matrix,))
+        # BLAS works on Fortran-ordered arrays: use the transpose of C-ordered ones
+        if matrix.flags.c_contiguous:
+            return syrk(1.0, matrix.T, trans=int(not transpose), lower=1)
+        return syrk(1.0, matrix, trans=int(transpose), lower=1)
+
+    matrix_T = tl.moveaxis(matrix, -1, -2)
+    if transpose:
+        return tl.matmul(matrix_T, matrix)
+    return tl.matmul(matrix, matrix_T)
+
+
+def symeig_svd(matrix, n_eigenvecs=None, compute_uv=True, **kwargs):
     """Computes a truncated SVD on `matrix` using symeig
 
         Uses symeig on matrix.T.dot(matrix) or its transpose
@@ -241,8 +409,11 @@ def symeig_svd(matrix, n_eigenvecs=None, **kwargs):
     Parameters
     ----------
     matrix : 2D-array
+        or a stack of matrices along the leading dimensions, which are decomposed at once
     n_eigenvecs : int, optional, default is None
         if specified, number of eigen[vectors-values] to return
+    compute_uv : bool, optional, default is True
+        if False, only the singular values are computed and U and V are None
     **kwargs : optional
         kwargs are used to absorb the difference of parameters among the other SVD functions
 
@@ -258,28 +429,39 @@ def symeig_svd(matrix, n_eigenvecs=None, **kwargs):
         of shape (n_eigenvecs, matrix.shape[1])
         contains the left singular vectors
     """
-    n_eigenvecs, _, _ = svd_checks(matrix, n_eigenvecs=n_eigenvecs)
+    n_eigenvecs, _, _ = svd_checks(matrix, n_eigenvecs=n_eigenvecs, batched=True)
 
-    dim_1, dim_2 = tl.shape(matrix)
+    dim_1, dim_2 = tl.shape(matrix)[-2:]
+    # Transpose of the last two dimensions, to support stacks of matrices
+    matrix_T = tl.moveaxis(matrix, -1, -2)
+
+    if not compute_uv:
+        # Only min(dim_1, dim_2) singular values are returned: use the smaller Gram matrix
+        if dim_1 > dim_2:
+            S = tl.eigvalsh(_gram(matrix, transpose=True))
+        else:
+            S = tl.eigvalsh(_gram(matrix))
+        S = tl.flip(tl.sqrt(tl.clip(S, tl.eps(S.dtype))), axis=-1)
+        return None, S[..., : min(dim_1, dim_2, n_eigenvecs)], None
 
     if dim_1 > dim_2:
-        S, U = tl.eigh(tl.dot(matrix, tl.transpose(matrix)))
+        S, U = tl.eigh(_gram(matrix))
         S = tl.sqrt(tl.clip(S, tl.eps(S.dtype)))
-        V = tl.dot(tl.transpose(matrix), U / tl.reshape(S, (1, -1)))
+        V = tl.matmul(matrix_T, U / S[..., None, :])
     else:
-        S, V = tl.eigh(tl.dot(tl.transpose(matrix), matrix))
+        S, V = tl.eigh(_gram(matrix, transpose=True))
         S = tl.sqrt(tl.clip(S, tl.eps(S.dtype)))
-        U = tl.dot(matrix, V) / tl.reshape(S, (1, -1))
+        U = tl.matmul(matrix, V) / S[..., None, :]
 
     U, S, V = (
-        tl.flip(U, axis=1),
-        tl.flip(S),
-        tl.flip(tl.transpose(V), axis=0),
+        tl.flip(U, axis=-1),
+        tl.flip(S, axis=-1),
+        tl.flip(tl.moveaxis(V, -1, -2), axis=-2),
     )
     return (
-        U[:, : min(dim_1, n_eigenvecs)],
-        S[: min(dim_1, dim_2, n_eigenvecs)],
-        V[: min(dim_2, n_eigenvecs), :],
+        U[..., : min(dim_1, n_eigenvecs)],
+        S[..., : min(dim_1, dim_2, n_eigenvecs)],
+        V[..., : min(dim_2, n_eigenvecs), :],
     )
 
 
@@ -289,6 +471,8 @@ def randomized_svd(
     n_oversamples=5,
     n_iter=2,
     random_state=None,
+    power_iteration_normalizer="gram",
+    iteration="subspace",
     **kwargs,
 ):
     """Computes a truncated randomized SVD.
@@ -307,6 +491,11 @@ def randomized_svd(
     n_iter: int, optional, default = 2
         number of power iterations for the `randomized_range_finder` subroutine
     random_state: {None, int, np.random.RandomState}
+    power_iteration_normalizer : {'gram', 'LU', 'QR', 'none'}, default is 'gram'
+        normalization of the power iterations in the `randomized_range_finder` subroutine
+    iteration : {'subspace', 'block_krylov'}, default is 'subspace'
+        whether the `randomized_range_finder` subroutine uses subspace or block Krylov
+        iterations, the latter being more accurate for slowly decaying spectra
     **kwargs : optional
         kwargs are used to absorb the difference of parameters among the other SVD functions
 
@@ -339,17 +528,27 @@ def randomized_svd(
         # transpose matrix to keep the reduced matrix shape minimal
         matrix_T = tl.transpose(matrix)
         Q = randomized_range_finder(
-            matrix_T, n_dims=n_dims, n_iter=n_iter, random_state=random_state
+            matrix_T,
+            n_dims=n_dims,
+            n_iter=n_iter,
+            random_state=random_state,
+            power_iteration_normalizer=power_iteration_normalizer,
+            iteration=iteration,
         )
-        Q_H = tl.conj(tl.transpose(Q))
-        matrix_reduced = tl.transpose(tl.dot(Q_H, matrix_T))
+        # (Q^H matrix^T)^T is computed directly as matrix conj(Q)
+        matrix_reduced = tl.dot(matrix, _conj(Q))
         U, S, V = truncated_svd(matrix_reduced, n_eigenvecs=n_eigenvecs)
         V = tl.dot(V, tl.transpose(Q))
     else:
         Q = randomized_range_finder(
-            matrix, n_dims=n_dims, n_iter=n_iter, random_state=random_state
+            matrix,
+            n_dims=n_dims,
+            n_iter=n_iter,
+            random_state=random_state,
+            power_iteration_normalizer=power_iteration_normalizer,
+            iteration=iteration,
         )
-        Q_H = tl.conj(tl.transpose(Q))
+        Q_H = _conj_transpose(Q)
         matrix_reduced = tl.dot(Q_H, matrix)
         U, S, V = truncated_svd(matrix_reduced, n_eigenvecs=n_eigenvecs)
         U = tl.dot(Q, U)
@@ -411,6 +610,17 @@ def svd_interface(
         Contains the left singular vectors of `matrix`
     """
 
+    # Sign flipping, imputation and non-negativity are only defined for a single matrix
+    if tl.ndim(matrix) != 2:
+        raise ValueError(f"matrix be a matrix. matrix.ndim is {tl.ndim(matrix)} != 2")
+
+    # Sign flipping, imputation and non-negativity all need the singular vectors
+    if kwargs.get("compute_uv", True) is False:
+        raise ValueError(
+            "svd_interface requires the singular vectors, got compute_uv=False. "
+            "To only compute the singular values, call symeig_svd directly."
+        )
+
     if method == "truncated_svd":
         svd_fun = truncated_svd
     elif method == "symeig_svd":
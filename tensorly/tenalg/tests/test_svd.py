@@ -1,6 +1,14 @@
 import pytest
-from ...testing import assert_
-from ..svd import svd_interface
+from ...testing import assert_, assert_array_almost_equal
+from ..svd import (
+    _gram_qr,
+    svd_interface,
+    svd_flip,
+    truncated_svd,
+    randomized_range_finder,
+    randomized_svd,
+    symeig_svd,
+)
 import tensorly as tl
 from ...testing import assert_
 
@@ -28,3 +36,124 @@ def test_svd_interface_shape(shape, rank, nn):
     if nn:
         assert_(tl.all(U >= 0.0))
         assert_(tl.all(V >= 0.0))
+
+
+@pytest.mark.parametrize("u_based_decision", [True, False])
+def test_svd_flip(u_based_decision):
+    """Test that svd_flip makes the largest loadings positive without changing the product."""
+    rng = tl.check_random_state(1234)
+    X = tl.tensor(rng.random_sample((8, 5)) - 0.5)
+    U, S, V = tl.svd(X, full_matrices=False)
+
+    U_flip, V_flip = svd_flip(U, V, u_based_decision=u_based_decision)
+    assert_array_almost_equal(tl.dot(U_flip * S, V_flip), X)
+
+    if u_based_decision:
+        max_abs = tl.argmax(tl.abs(U_flip), axis=0)
+        loadings = U_flip[max_abs, list(range(tl.shape(U_flip)[1]))]
+    else:
+        max_abs = tl.argmax(tl.abs(V_flip), axis=1)
+        loadings = V_flip[list(range(tl.shape(V_flip)[0])), max_abs]
+    assert_(tl.all(loadings > 0.0))
+
+
+@pytest.mark.parametrize("shape", [(30, 10), (10, 30)])
+@pytest.mark.parametrize("n_iter", [0, 2])
+@pytest.mark.parametrize("normalizer", ["gram", "LU", "QR", "none"])
+@pytest.mark.parametrize("low_rank", [True, False])
+def test_randomized_range_finder(shape, n_iter, normalizer, low_rank):
+    """Test that randomized_range_finder returns an orthonormal basis of the range."""
+    rng = tl.check_random_state(1234)
+    if low_rank:
+        rank = 4
+        A = tl.tensor(
+            rng.random_sample((shape[0], rank)) @ rng.random_sample((rank, shape[1]))
+        )
+    else:
+        A = tl.tensor(rng.random_sample(shape))
+
+    Q = randomized_range_finder(
+        A,
+        n_dims=6,
+        n_iter=n_iter,
+        random_state=rng,
+        power_iteration_normalizer=normalizer,
+    )
+    assert_(tl.shape(Q) == (shape[0], 6))
+    assert_array_almost_equal(tl.dot(tl.transpose(Q), Q), tl.eye(6))
+    if low_rank:
+        # The range of A is entirely captured
+        assert_array_almost_equal(tl.dot(Q, tl.dot(tl.transpose(Q), A)), A)
+
+
+def test_gram_qr():
+    """Test that _gram_qr orthonormalizes well-conditioned tall matrices only."""
+    rng = tl.check_random_state(1234)
+    Y = tl.tensor(rng.random_sample((30, 6)))
+
+    Q = _gram_qr(Y)
+    assert_(Q is not None)
+    assert_(tl.shape(Q) == (30, 6))
+    assert_array_almost_equal(tl.dot(tl.transpose(Q), Q), tl.eye(6))
+    # Q spans the range of Y
+    assert_array_almost_equal(tl.dot(Q, tl.dot(tl.transpose(Q), Y)), Y)
+
+    # Rank deficient and wide matrices are left to QR
+    Y_low_rank = tl.tensor(rng.random_sample((30, 4)) @ rng.random_sample((4, 6)))
+    assert_(_gram_qr(Y_low_rank) is None)
+    assert_(_gram_qr(tl.transpose(Y)) is None)
+
+
+@pytest.mark.parametrize("shape", [(10, 5), (10, 10), (5, 10)])
+@pytest.mark.parametrize("rank", [3, 5, 8])
+def test_symeig_svd_compute_uv(shape, rank):
+    """Test that symeig_svd returns the same singular values with compute_uv=False."""
+    rng = tl.check_random_state(1234)
+    X = tl.tensor(rng.random_sample(shape))
+
+    _, S, _ = symeig_svd(X, n_eigenvecs=rank)
+    U, S_only, V = symeig_svd(X, n_eigenvecs=rank, compute_uv=False)
+    assert_(U is None and V is None)
+    assert_array_almost_equal(S_only, S)
+
+
+@pytest.mark.parametrize("iteration", ["subspace", "block_krylov"])
+def test_randomized_svd_iteration(iteration):
+    """Test that randomized_svd recovers the leading singular values of a low rank matrix."""
+    rng = tl.check_random_state(1234)
+    rank = 5
+    X = tl.tensor(rng.random_sample((40, rank)) @ rng.random_sample((rank, 30)))
+
+    U, S, V = randomized_svd(
+        X, n_eigenvecs=rank, n_iter=1, random_state=rng, iteration=iteration
+    )
+    _, true_S, _ = tl.svd(X, full_matrices=False)
+    assert_array_almost_equal(S, true_S[:rank])
+    assert_array_almost_equal(tl.dot(U * S, V), X)
+
+
+@pytest.mark.parametrize("svd_fun", [truncated_svd, symeig_svd])
+@pytest.mark.parametrize("shape", [(10, 5), (5, 10)])
+def test_batched_svd(svd_fun, shape):
+    """Test that a stack of matrices is decomposed like each matrix on its own."""
+    rng = tl.check_random_state(1234)
+    rank = 3
+    X = tl.tensor(rng.random_sample((4,) + shape))
+
+    U, S, V = svd_fun(X, n_eigenvecs=rank)
+    assert_(tl.shape(U) == (4, shape[0], rank))
+    assert_(tl.shape(S) == (4, rank))
+    assert_(tl.shape(V) == (4, rank, shape[1]))
+    for i in range(4):
+        U_i, S_i, V_i = svd_fun(X[i], n_eigenvecs=rank)
+        assert_array_almost_equal(S[i], S_i)
+        assert_array_almost_equal(tl.dot(U[i] * S[i], V[i]), tl.dot(U_i * S_i, V_i))
+
+
+def test_svd_interface_compute_uv():
+    """Test that svd_interface rejects compute_uv=False, as it needs U and V."""
+    rng = tl.check_random_state(1234)
+    X = tl.tensor(rng.random_sample((10, 5)))
+
+    with pytest.raises(ValueError):
+        svd_interface(X, method="symeig_svd", n_eigenvecs=3, compute_uv=False)